@@ -1,3 +1,4 @@
+import os
 import streamlit as st
 import pandas as pd
 import numpy as np
@@ -5,16 +6,17 @@ import plotly.express as px
 import plotly.graph_objects as go
 from PIL import Image
 
-# Page configuration
-st.set_page_config(
-    page_title="IPL Analytics Dashboard",
-    page_icon="🏏",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
-# Custom CSS
-st.markdown("""
+# ============================================
+# UI CONSTANTS
+# ============================================
+# Built once at import so reruns reuse the same objects
+
+CSS = """
     <style>
     .main-header {
         font-size: 48px;
@@ -32,31 +34,120 @@ st.markdown("""
         box-shadow: 2px 2px 5px rgba(0,0,0,0.1);
     }
     </style>
-""", unsafe_allow_html=True)
+"""
+
+FOOTER_HTML = """
+    <hr>
+    <div style='text-align: center; color: gray;'>
+        <p>🏏 IPL Analytics Dashboard | Made with ❤️ by Jeevan</p>
+        <p>Data Source: IPL 2008-2024 | Technology: Python, Streamlit, Plotly</p>
+    </div>
+"""
+
+COLOR_SCALES = {
+    name: getattr(px.colors.sequential, name)
+    for name in ['Blues', 'Greens', 'Oranges', 'Purples', 'Reds', 'YlOrRd']
+}
+
+# Shared layout for the horizontal top-N bar charts
+HBAR_LAYOUT = {'showlegend': False, 'yaxis': {'categoryorder': 'total ascending'}}
+
+# Page configuration
+st.set_page_config(
+    page_title="IPL Analytics Dashboard",
+    page_icon="🏏",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# Custom CSS
+st.markdown(CSS, unsafe_allow_html=True)
+
+# ============================================
+# CHART HELPERS
+# ============================================
+
+def bar_chart(labels, values, scale, label_title, value_title, horizontal=True):
+    """Bar chart colored by value, built straight from arrays"""
+    x, y = (values, labels) if horizontal else (labels, values)
+    fig = go.Figure(go.Bar(
+        x=x, y=y, orientation='h' if horizontal else 'v',
+        marker=dict(color=values, colorscale=scale, showscale=True,
+                    colorbar=dict(title=value_title)),
+    ))
+    x_title, y_title = (value_title, label_title) if horizontal else (label_title, value_title)
+    fig.update_layout(xaxis_title=x_title, yaxis_title=y_title)
+    return fig
 
 # ============================================
 # LOAD DATA
 # ============================================
 
-@st.cache_data
+MATCH_COLUMNS = ['id', 'season', 'city', 'player_of_match', 'venue',
+                 'team1', 'team2', 'toss_winner', 'winner', 'result']
+DELIVERY_COLUMNS = ['match_id', 'batter', 'bowler', 'batsman_runs', 'total_runs',
+                    'player_dismissed', 'dismissal_kind', 'season']
+TEAM_COLUMNS = ['team1', 'team2', 'toss_winner', 'winner']
+
+def convert_to_parquet():
+    """Convert the raw CSVs to Parquet once, attaching season to deliveries"""
+    if os.path.exists('matches.parquet') and os.path.exists('deliveries.parquet'):
+        return
+    
+    matches = pd.read_csv('matches.csv')
+    deliveries = pd.read_csv('deliveries.csv')
+    
+    # Attach season to deliveries with a match_id lookup instead of a full merge
+    season_map = dict(zip(matches['id'].to_numpy(), matches['season'].to_numpy()))
+    deliveries['season'] = deliveries['match_id'].map(season_map)
+    
+    # load_data() downcasts these columns; check once that the values fit
+    assert deliveries[['batsman_runs', 'total_runs']].abs().max().max() <= np.iinfo(np.int8).max
+    assert max(matches['id'].max(), deliveries['match_id'].max()) <= np.iinfo(np.int32).max
+    
+    matches.to_parquet('matches.parquet', compression='zstd')
+    deliveries.to_parquet('deliveries.parquet', compression='zstd')
+
+# cache_resource hands every rerun the same frames instead of a fresh
+# copy; the pages only read from them and never modify them in place
+@st.cache_resource
 def load_data():
     """Load IPL datasets"""
     try:
-        matches = pd.read_csv('matches.csv')
-        deliveries = pd.read_csv('deliveries.csv')
+        convert_to_parquet()
+        matches = pd.read_parquet('matches.parquet', columns=MATCH_COLUMNS)
+        deliveries = pd.read_parquet('deliveries.parquet', columns=DELIVERY_COLUMNS)
         
         # Data cleaning
-        matches['city'].fillna('Unknown', inplace=True)
-        matches['winner'].fillna('No Result', inplace=True)
-        matches['player_of_match'].fillna('Unknown', inplace=True)
+        matches = matches.fillna({
+            'city': 'Unknown',
+            'winner': 'No Result',
+            'player_of_match': 'Unknown',
+        })
         
-        # Merge deliveries with matches to get season info
-        deliveries = deliveries.merge(
-            matches[['id', 'season']], 
-            left_on='match_id', 
-            right_on='id', 
-            how='left'
-        )
+        # Categorical columns group and count on integer codes; team columns
+        # share one dtype so they stay comparable with each other. Numeric
+        # columns are downcast to the smallest integer type that fits.
+        team_dtype = pd.CategoricalDtype(sorted(set(matches[TEAM_COLUMNS].stack())))
+        season_dtype = pd.CategoricalDtype(sorted(matches['season'].unique()))
+        matches = matches.astype({
+            'id': 'int32',
+            **dict.fromkeys(TEAM_COLUMNS, team_dtype),
+            'season': season_dtype,
+            'player_of_match': 'category',
+            'venue': 'category',
+            'city': 'category',
+            'result': 'category',
+        })
+        deliveries = deliveries.astype({
+            'match_id': 'int32',
+            'batsman_runs': 'int8',
+            'total_runs': 'int8',
+            'batter': 'category',
+            'bowler': 'category',
+            'dismissal_kind': 'category',
+            'season': season_dtype,
+        })
         
         return matches, deliveries
     except Exception as e:
@@ -65,6 +156,195 @@ def load_data():
 
 matches, deliveries = load_data()
 
+# ============================================
+# CACHED AGGREGATIONS
+# ============================================
+
+def topk_counts(series, k):
+    """Top-k most frequent labels and their counts, most frequent first"""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy()
+        values = series.cat.categories.to_numpy()
+        counts = np.bincount(codes[codes >= 0], minlength=len(values))
+    else:
+        values, counts = np.unique(series.dropna().to_numpy(), return_counts=True)
+    
+    # argpartition finds the top-k in O(N); only those k get sorted
+    k = min(k, counts.size)
+    if k == 0:
+        return values[:0], counts[:0]
+    idx = np.argpartition(counts, -k)[-k:]
+    idx = idx[np.argsort(-counts[idx], kind='stable')]
+    idx = idx[counts[idx] > 0]
+    return values[idx], counts[idx]
+
+def topk_series(series, k):
+    """topk_counts as a label-indexed Series"""
+    values, counts = topk_counts(series, k)
+    return pd.Series(counts, index=values)
+
+def _wicket_counts(codes, mask, n):
+    """Wickets per bowler code, counting deliveries where mask is set"""
+    out = np.zeros(n, np.int64)
+    for i in range(codes.size):
+        if mask[i] and codes[i] >= 0:
+            out[codes[i]] += 1
+    return out
+
+if njit is not None:
+    wicket_counts = njit(cache=True)(_wicket_counts)
+else:
+    def wicket_counts(codes, mask, n):
+        """Wickets per bowler code (numpy fallback when numba is missing)"""
+        return np.bincount(codes[mask & (codes >= 0)], minlength=n)
+
+# Categorical group-bys use observed=True, sort=False and order the
+# small result afterwards.
+#
+# The leading underscore keeps Streamlit from hashing the large frames;
+# the data never changes within a session, so each table is built once
+# and pages only slice the top-N they need.
+
+@st.cache_data
+def top_batsmen_table(_deliveries):
+    """Total runs per batter, highest first"""
+    return _deliveries.groupby('batter', observed=True, sort=False)['batsman_runs'].sum().sort_values(ascending=False)
+
+@st.cache_data
+def top_bowlers_table(_deliveries):
+    """Total wickets per bowler, highest first"""
+    bowler = _deliveries['bowler']
+    codes = bowler.cat.codes.to_numpy(np.int32)
+    mask = _deliveries['player_dismissed'].notna().to_numpy()
+    counts = wicket_counts(codes, mask, len(bowler.cat.categories))
+    wickets = pd.Series(counts, index=bowler.cat.categories)
+    return wickets[wickets > 0].sort_values(ascending=False)
+
+@st.cache_data
+def runs_per_season(_deliveries):
+    """Total runs scored in each season"""
+    return _deliveries.groupby('season', observed=True, sort=False)['total_runs'].sum().sort_index()
+
+@st.cache_data
+def pom_counts(_matches, k):
+    """Top-k players by Player of the Match awards"""
+    return topk_series(_matches['player_of_match'], k)
+
+@st.cache_data
+def venue_counts(_matches, k):
+    """Top-k venues by matches hosted"""
+    return topk_series(_matches['venue'], k)
+
+@st.cache_data
+def city_counts(_matches, k):
+    """Top-k cities by matches hosted"""
+    return topk_series(_matches['city'], k)
+
+@st.cache_data
+def dismissal_counts(_deliveries, k):
+    """Top-k dismissal types"""
+    return topk_series(_deliveries['dismissal_kind'], k)
+
+@st.cache_data
+def team_wins_counts(_matches, k):
+    """Top-k teams by match wins"""
+    return topk_series(_matches['winner'], k)
+
+@st.cache_data
+def home_summary(_matches):
+    """All Home page metrics, computed once"""
+    # Team columns share one categorical dtype, so codes compare directly
+    winner = _matches['winner'].cat.codes.to_numpy()
+    toss_winner = _matches['toss_winner'].cat.codes.to_numpy()
+    no_result = _matches['winner'].cat.categories.get_indexer(['No Result'])[0]
+    mask = winner != no_result
+    toss_won = toss_winner[mask] == winner[mask]
+    return {
+        'n_matches': len(_matches),
+        'n_seasons': _matches['season'].nunique(),
+        'n_teams': _matches['team1'].nunique(),
+        'n_venues': _matches['venue'].nunique(),
+        'matches_per_season': _matches.groupby('season', observed=True, sort=False).size().sort_index(),
+        'top5_winners': team_wins_counts(_matches, 5),
+        'toss_impact': [int(toss_won.sum()), int((~toss_won).sum())],
+    }
+
+@st.cache_data
+def team_list(_matches):
+    """Teams for the Team Analysis selector, sorted by name"""
+    # The shared team dtype is already sorted, but also holds 'No Result'
+    # and any team never listed as team1, so drop unused categories
+    return _matches['team1'].cat.remove_unused_categories().cat.categories.tolist()
+
+@st.cache_data
+def team_index(_matches):
+    """Per-team match counts, season wins and top venues, keyed by team"""
+    # Team columns share one categorical dtype, so one code identifies a team
+    team1 = _matches['team1'].cat.codes.to_numpy()
+    team2 = _matches['team2'].cat.codes.to_numpy()
+    winner = _matches['winner'].cat.codes.to_numpy()
+    index = {}
+    for code, team in enumerate(_matches['team1'].cat.categories):
+        played = (team1 == code) | (team2 == code)
+        if not played.any():
+            continue
+        won = _matches.iloc[winner == code]
+        index[team] = {
+            'played': int(played.sum()),
+            'won': len(won),
+            'season_wins': won.groupby('season', observed=True, sort=False).size().sort_index(),
+            'venues': topk_series(won['venue'], 5),
+        }
+    return index
+
+# ============================================
+# PLAYER STATS TABS
+# ============================================
+# Each tab is a fragment, so moving its slider re-runs only that tab
+# instead of the whole script.
+
+@st.fragment
+def batsmen_tab(deliveries):
+    """Top run scorers, re-run on its own when the slider moves"""
+    st.subheader("Top Run Scorers in IPL History")
+    num_batsmen = st.slider("Number of batsmen to display", 5, 20, 10)
+    
+    top_batsmen = top_batsmen_table(deliveries).head(num_batsmen)
+    
+    fig = px.bar(x=top_batsmen.to_numpy(), y=top_batsmen.index.to_numpy(), orientation='h',
+                color=top_batsmen.to_numpy(), color_continuous_scale=COLOR_SCALES['YlOrRd'],
+                labels={'x': 'Total Runs', 'y': 'Batsman', 'color': 'Total Runs'})
+    fig.update_layout(height=500, **HBAR_LAYOUT)
+    st.plotly_chart(fig, use_container_width=True)
+
+@st.fragment
+def bowlers_tab(deliveries):
+    """Top wicket takers, re-run on its own when the slider moves"""
+    st.subheader("Top Wicket Takers in IPL History")
+    num_bowlers = st.slider("Number of bowlers to display", 5, 20, 10)
+    
+    top_bowlers = top_bowlers_table(deliveries).head(num_bowlers)
+    
+    fig = px.bar(x=top_bowlers.to_numpy(), y=top_bowlers.index.to_numpy(), orientation='h',
+                color=top_bowlers.to_numpy(), color_continuous_scale=COLOR_SCALES['Purples'],
+                labels={'x': 'Total Wickets', 'y': 'Bowler', 'color': 'Total Wickets'})
+    fig.update_layout(height=500, **HBAR_LAYOUT)
+    st.plotly_chart(fig, use_container_width=True)
+
+@st.fragment
+def pom_tab(matches):
+    """Player of the Match leaderboard, re-run on its own when the slider moves"""
+    st.subheader("Player of the Match Awards")
+    num_players = st.slider("Number of players to display", 5, 20, 10)
+    
+    top_pom = pom_counts(matches, num_players)
+    
+    fig = px.bar(x=top_pom.to_numpy(), y=top_pom.index.to_numpy(), orientation='h',
+                color=top_pom.to_numpy(), color_continuous_scale=COLOR_SCALES['Greens'],
+                labels={'x': 'Awards', 'y': 'Player', 'color': 'Awards'})
+    fig.update_layout(height=500, **HBAR_LAYOUT)
+    st.plotly_chart(fig, use_container_width=True)
+
 # ============================================
 # SIDEBAR
 # ============================================
@@ -89,26 +369,27 @@ if page == "🏠 Home":
     st.markdown("### Comprehensive Analysis of Indian Premier League (2008-2024)")
     
     if matches is not None:
+        summary = home_summary(matches)
+        
         # Key Statistics
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            st.metric("Total Matches", len(matches))
+            st.metric("Total Matches", summary['n_matches'])
         with col2:
-            st.metric("Total Seasons", matches['season'].nunique())
+            st.metric("Total Seasons", summary['n_seasons'])
         with col3:
-            st.metric("Total Teams", matches['team1'].nunique())
+            st.metric("Total Teams", summary['n_teams'])
         with col4:
-            st.metric("Total Venues", matches['venue'].nunique())
+            st.metric("Total Venues", summary['n_venues'])
         
         st.markdown("---")
         
         # Matches per season
         st.subheader("📈 Matches Played Per Season")
-        matches_per_season = matches.groupby('season').size().reset_index(name='matches')
-        fig = px.bar(matches_per_season, x='season', y='matches',
-                     color='matches', color_continuous_scale='Blues',
-                     labels={'season': 'Season', 'matches': 'Number of Matches'})
+        matches_per_season = summary['matches_per_season']
+        fig = bar_chart(matches_per_season.index.to_numpy(), matches_per_season.to_numpy(),
+                        COLOR_SCALES['Blues'], 'Season', 'Number of Matches', horizontal=False)
         fig.update_layout(showlegend=False, height=400)
         st.plotly_chart(fig, use_container_width=True)
         
@@ -117,22 +398,16 @@ if page == "🏠 Home":
         
         with col1:
             st.subheader("🏆 Top 5 Teams by Wins")
-            team_wins = matches['winner'].value_counts().head(5).reset_index()
-            team_wins.columns = ['Team', 'Wins']
-            fig = px.bar(team_wins, x='Wins', y='Team', orientation='h',
-                        color='Wins', color_continuous_scale='Greens')
-            fig.update_layout(showlegend=False, height=300, yaxis={'categoryorder':'total ascending'})
+            team_wins = summary['top5_winners']
+            fig = bar_chart(team_wins.index.to_numpy(), team_wins.to_numpy(),
+                            COLOR_SCALES['Greens'], 'Team', 'Wins')
+            fig.update_layout(height=300, **HBAR_LAYOUT)
             st.plotly_chart(fig, use_container_width=True)
         
         with col2:
             st.subheader("🪙 Toss Impact Analysis")
-            matches_with_result = matches[matches['winner'] != 'No Result'].copy()
-            matches_with_result['toss_winner_is_match_winner'] = (
-                matches_with_result['toss_winner'] == matches_with_result['winner']
-            )
-            toss_impact = matches_with_result['toss_winner_is_match_winner'].value_counts()
             fig = go.Figure(data=[go.Pie(labels=['Won Match', 'Lost Match'], 
-                                         values=toss_impact.values,
+                                         values=summary['toss_impact'],
                                          hole=.3)])
             fig.update_layout(height=300)
             st.plotly_chart(fig, use_container_width=True)
@@ -146,24 +421,23 @@ elif page == "📊 Team Analysis":
     
     if matches is not None:
         # Team selector
-        teams = sorted(matches['team1'].unique())
+        teams = team_list(matches)
         selected_team = st.selectbox("Select a Team", teams)
         
         # Team stats
-        team_matches = matches[(matches['team1'] == selected_team) | (matches['team2'] == selected_team)]
-        team_wins = matches[matches['winner'] == selected_team]
+        team_stats = team_index(matches)[selected_team]
         
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            st.metric("Total Matches", len(team_matches))
+            st.metric("Total Matches", team_stats['played'])
         with col2:
-            st.metric("Total Wins", len(team_wins))
+            st.metric("Total Wins", team_stats['won'])
         with col3:
-            win_rate = (len(team_wins) / len(team_matches) * 100) if len(team_matches) > 0 else 0
+            win_rate = (team_stats['won'] / team_stats['played'] * 100) if team_stats['played'] > 0 else 0
             st.metric("Win Rate", f"{win_rate:.1f}%")
         with col4:
-            total_losses = len(team_matches) - len(team_wins)
+            total_losses = team_stats['played'] - team_stats['won']
             st.metric("Total Losses", total_losses)
         
         st.markdown("---")
@@ -173,19 +447,18 @@ elif page == "📊 Team Analysis":
         
         with col1:
             st.subheader(f"🏆 {selected_team} - Season Wise Wins")
-            season_wins = team_wins.groupby('season').size().reset_index(name='wins')
-            fig = px.line(season_wins, x='season', y='wins', markers=True,
-                         labels={'season': 'Season', 'wins': 'Wins'})
-            fig.update_layout(height=350)
+            season_wins = team_stats['season_wins']
+            fig = go.Figure(go.Scatter(x=season_wins.index.to_numpy(), y=season_wins.to_numpy(),
+                                       mode='lines+markers'))
+            fig.update_layout(height=350, xaxis_title='Season', yaxis_title='Wins')
             st.plotly_chart(fig, use_container_width=True)
         
         with col2:
             st.subheader(f"🏟️ Top Venues for {selected_team}")
-            venue_performance = team_wins['venue'].value_counts().head(5).reset_index()
-            venue_performance.columns = ['Venue', 'Wins']
-            fig = px.bar(venue_performance, x='Wins', y='Venue', orientation='h',
-                        color='Wins', color_continuous_scale='Oranges')
-            fig.update_layout(showlegend=False, height=350, yaxis={'categoryorder':'total ascending'})
+            venue_performance = team_stats['venues']
+            fig = bar_chart(venue_performance.index.to_numpy(), venue_performance.to_numpy(),
+                            COLOR_SCALES['Oranges'], 'Venue', 'Wins')
+            fig.update_layout(height=350, **HBAR_LAYOUT)
             st.plotly_chart(fig, use_container_width=True)
 
 # ============================================
@@ -199,43 +472,13 @@ elif page == "⭐ Player Stats":
         tab1, tab2, tab3 = st.tabs(["🏏 Batsmen", "⚾ Bowlers", "🏅 Awards"])
         
         with tab1:
-            st.subheader("Top Run Scorers in IPL History")
-            num_batsmen = st.slider("Number of batsmen to display", 5, 20, 10)
-            
-            # Fixed: using 'batter' instead of 'batsman'
-            top_batsmen = deliveries.groupby('batter')['batsman_runs'].sum().sort_values(ascending=False).head(num_batsmen).reset_index()
-            top_batsmen.columns = ['Batsman', 'Total Runs']
-            
-            fig = px.bar(top_batsmen, x='Total Runs', y='Batsman', orientation='h',
-                        color='Total Runs', color_continuous_scale='YlOrRd')
-            fig.update_layout(height=500, yaxis={'categoryorder':'total ascending'})
-            st.plotly_chart(fig, use_container_width=True)
+            batsmen_tab(deliveries)
         
         with tab2:
-            st.subheader("Top Wicket Takers in IPL History")
-            num_bowlers = st.slider("Number of bowlers to display", 5, 20, 10)
-            
-            # Fixed: using 'player_dismissed' to check for wickets
-            wickets = deliveries[deliveries['player_dismissed'].notna()]
-            top_bowlers = wickets.groupby('bowler').size().sort_values(ascending=False).head(num_bowlers).reset_index()
-            top_bowlers.columns = ['Bowler', 'Total Wickets']
-            
-            fig = px.bar(top_bowlers, x='Total Wickets', y='Bowler', orientation='h',
-                        color='Total Wickets', color_continuous_scale='Purples')
-            fig.update_layout(height=500, yaxis={'categoryorder':'total ascending'})
-            st.plotly_chart(fig, use_container_width=True)
+            bowlers_tab(deliveries)
         
         with tab3:
-            st.subheader("Player of the Match Awards")
-            num_players = st.slider("Number of players to display", 5, 20, 10)
-            
-            top_pom = matches['player_of_match'].value_counts().head(num_players).reset_index()
-            top_pom.columns = ['Player', 'Awards']
-            
-            fig = px.bar(top_pom, x='Awards', y='Player', orientation='h',
-                        color='Awards', color_continuous_scale='Greens')
-            fig.update_layout(height=500, yaxis={'categoryorder':'total ascending'})
-            st.plotly_chart(fig, use_container_width=True)
+            pom_tab(matches)
 
 # ============================================
 # VENUE ANALYSIS PAGE
@@ -249,20 +492,19 @@ elif page == "🏟️ Venue Analysis":
         
         with col1:
             st.subheader("Top Venues by Number of Matches")
-            top_venues = matches['venue'].value_counts().head(10).reset_index()
-            top_venues.columns = ['Venue', 'Matches']
+            top_venues = venue_counts(matches, 10)
             
-            fig = px.bar(top_venues, x='Matches', y='Venue', orientation='h',
-                        color='Matches', color_continuous_scale='Blues')
-            fig.update_layout(height=400, yaxis={'categoryorder':'total ascending'})
+            fig = bar_chart(top_venues.index.to_numpy(), top_venues.to_numpy(),
+                            COLOR_SCALES['Blues'], 'Venue', 'Matches')
+            fig.update_layout(height=400, **HBAR_LAYOUT)
             st.plotly_chart(fig, use_container_width=True)
         
         with col2:
             st.subheader("City-wise Match Distribution")
-            city_matches = matches['city'].value_counts().head(10).reset_index()
-            city_matches.columns = ['City', 'Matches']
+            city_matches = city_counts(matches, 10)
             
-            fig = px.pie(city_matches, values='Matches', names='City', hole=0.3)
+            fig = go.Figure(go.Pie(labels=city_matches.index.to_numpy(),
+                                   values=city_matches.to_numpy(), hole=0.3))
             fig.update_layout(height=400)
             st.plotly_chart(fig, use_container_width=True)
 
@@ -276,11 +518,10 @@ elif page == "📈 Trends & Insights":
     if matches is not None and deliveries is not None:
         # Total runs per season (Fixed: now deliveries has season column from merge)
         st.subheader("🏏 Total Runs Scored Per Season")
-        runs_per_season = deliveries.groupby('season')['total_runs'].sum().reset_index()
-        runs_per_season.columns = ['Season', 'Total Runs']
+        season_runs = runs_per_season(deliveries)
         
-        fig = px.area(runs_per_season, x='Season', y='Total Runs',
-                     labels={'Season': 'Season', 'Total Runs': 'Total Runs Scored'})
+        fig = px.area(x=season_runs.index.to_numpy(), y=season_runs.to_numpy(),
+                     labels={'x': 'Season', 'y': 'Total Runs Scored'})
         fig.update_layout(height=400)
         st.plotly_chart(fig, use_container_width=True)
         
@@ -290,31 +531,24 @@ elif page == "📈 Trends & Insights":
         
         with col1:
             st.subheader("📊 Result Type Distribution")
-            result_type = matches['result'].value_counts().reset_index()
-            result_type.columns = ['Result Type', 'Count']
+            result_type = matches['result'].value_counts()
             
-            fig = px.pie(result_type, values='Count', names='Result Type', hole=0.3)
+            fig = px.pie(values=result_type.to_numpy(), names=result_type.index.to_numpy(), hole=0.3)
             fig.update_layout(height=350)
             st.plotly_chart(fig, use_container_width=True)
         
         with col2:
             st.subheader("🎯 Dismissal Types")
-            dismissal_types = deliveries['dismissal_kind'].value_counts().head(8).reset_index()
-            dismissal_types.columns = ['Dismissal Type', 'Count']
+            dismissal_types = dismissal_counts(deliveries, 8)
             
-            fig = px.bar(dismissal_types, x='Count', y='Dismissal Type', orientation='h',
-                        color='Count', color_continuous_scale='Reds')
-            fig.update_layout(showlegend=False, height=350, yaxis={'categoryorder':'total ascending'})
+            fig = px.bar(x=dismissal_types.to_numpy(), y=dismissal_types.index.to_numpy(), orientation='h',
+                        color=dismissal_types.to_numpy(), color_continuous_scale=COLOR_SCALES['Reds'],
+                        labels={'x': 'Count', 'y': 'Dismissal Type', 'color': 'Count'})
+            fig.update_layout(height=350, **HBAR_LAYOUT)
             st.plotly_chart(fig, use_container_width=True)
 
 # ============================================
 # FOOTER
 # ============================================
 
-st.markdown("---")
-st.markdown("""
-    <div style='text-align: center; color: gray;'>
-        <p>🏏 IPL Analytics Dashboard | Made with ❤️ by Jeevan</p>
-        <p>Data Source: IPL 2008-2024 | Technology: Python, Streamlit, Plotly</p>
-    </div>
-""", unsafe_allow_html=True)
\ No newline at end of file
+st.html(FOOTER_HTML)
\ No newline at end of file